@@ -1,5 +1,47 @@
+import sys
+from threading import Thread
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class DRFOpenApi3Config(AppConfig):
     name = 'drf_openapi3'
+
+    # Management commands that shouldn't trigger schema generation
+    skip_commands = ("makemigrations", "migrate", "collectstatic", "shell", "test")
+
+    def ready(self):
+        """
+        Optionally warm the schema cache at process start, so the first
+        hit on the documentation endpoint doesn't pay the full
+        generation cost. Enable with "DRF_OPENAPI_WARM_CACHE = True"
+        and point "DRF_OPENAPI_WARM_GENERATOR" at the generator (or a
+        zero-argument factory for one) configured like the serving view:
+        the cache key includes the generator configuration, so a
+        default-configured warm-up only serves default-configured
+        requests.
+        """
+        if not getattr(settings, "DRF_OPENAPI_WARM_CACHE", False):
+            return
+        if any(command in sys.argv for command in self.skip_commands):
+            return
+        # Build in the background, the result lands in the Django cache
+        Thread(target=self._warm_schema_cache, daemon=True).start()
+
+    @staticmethod
+    def _warm_schema_cache():
+        from django.utils.module_loading import import_string
+        from drf_openapi3.schemas.advanced import AdvancedSchemaGenerator
+        generator = getattr(settings, "DRF_OPENAPI_WARM_GENERATOR", None)
+        try:
+            if isinstance(generator, str):
+                generator = import_string(generator)
+            if callable(generator):
+                generator = generator()
+            if generator is None:
+                generator = AdvancedSchemaGenerator()
+            generator.get_schema(request=None, public=True)
+        except Exception:
+            # Warm-up is best effort, a real request will surface errors
+            pass
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from drf_openapi3.schemas.advanced import clear_schema_cache
+
+
+class Command(BaseCommand):
+    help = "Invalidate cached OpenAPI schemas (e.g. after a deploy)"
+
+    def handle(self, *args, **options):
+        clear_schema_cache()
+        self.stdout.write("OpenAPI schema cache cleared")
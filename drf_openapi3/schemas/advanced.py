@@ -1,14 +1,19 @@
+import copy
+import functools
+import hashlib
+import json
+import re
 import warnings
-from typing import Dict
+from typing import Dict, List, Tuple
 
-import yaml
 from django.conf import settings
+from django.core.cache import cache
+from django.test.signals import setting_changed
 from django.utils.encoding import smart_str
 from django.utils.html import strip_tags
 from rest_framework import serializers
 from rest_framework.settings import api_settings
 from rest_framework.utils import formatting
-from yaml.scanner import ScannerError
 
 from drf_openapi3.schemas.openapi import AutoSchema, SchemaGenerator
 from drf_openapi3.schemas.utils import is_list_view
@@ -19,6 +24,149 @@ from drf_openapi3.settings import (
 )
 
 
+_SCHEMA_CACHE_VERSION_KEY = "drf_openapi3:schema:version"
+
+# Constant security declaration attached to every generated schema;
+# shared by reference, must not be mutated downstream
+_SECURITY_SCHEMES = {
+    "ApiKeyAuth": {
+        "type": "apiKey",
+        "in": "header",
+        "name": "Authorization",
+        "description": "Enter your bearer token in the format **Token &lt;token&gt;**",
+    }
+}
+_SECURITY = [{"ApiKeyAuth": []}]
+
+# Parsed docstrings per (method, docstring text): views sharing a
+# docstring share the parse. Docstrings are immutable at runtime, but
+# the parse embeds the SCHEMA_COERCE_METHOD_NAMES coercion, so the
+# setting_changed handler below drops it alongside _coerce_method_name.
+_DOCSTRING_CACHE: Dict[Tuple[str, str], List[dict]] = {}
+
+# Matches a "key: value" YAML mapping line, the only structure
+# _get_yaml_docstring() can make use of
+_YAML_HINT = re.compile(r'^\s*[A-Za-z_][\w\- ]*:\s', re.M)
+
+# Strips leading/trailing blanks on every line in one pass,
+# like str.strip() per line but without the Python-level loop
+_LINE_EDGE_WS = re.compile(r'^[ \t]+|[ \t]+$', re.M)
+
+# Docstring properties recognized by _get_yaml_docstring(),
+# invalid ones will be ignored
+_VALID_PROPERTIES = frozenset((
+    "summary", "description", "tags", "responses",
+    200, 201, 202, 204, 400, 401, 403, 404, 500, 502, 503
+))
+_DEFAULT_MANY = dict.fromkeys(_VALID_PROPERTIES, False)
+
+
+# Fallback view descriptions pulled from the parent class, per view
+# class: computing one instantiates the parent view, don't repeat that
+# for every method
+_PARENT_DOCSTRING_CACHE: Dict[type, str] = {}
+
+# Mapped serializers per serializer class: the mapping only depends on
+# the class, not on the request being documented
+_SERIALIZER_SCHEMA_CACHE: Dict[type, dict] = {}
+
+# Error description/schema pairs shared by every response that uses the
+# default error schema; built once, the strings and schema are immutable
+_ERROR_FRAGMENTS = {
+    code: {"description": response["description"], "schema": DEFAULT_ERROR_SCHEMA}
+    for code, response in STATUS_CODES_RESPONSES.items()
+}
+
+# Ready-made error responses per (response media types, status code):
+# they only depend on constants from settings, so build each once
+_ERROR_RESPONSE_CACHE: Dict[Tuple[tuple, int], dict] = {}
+
+# Complete allowed-responses dicts per (method, cardinality, allowed
+# codes, media types, schema shape)
+_ALLOWED_RESPONSES_CACHE: Dict[tuple, dict] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _coerce_method_name(method: str) -> str:
+    """
+    Resolve the docstring section name for a lowercase method in one
+    hash lookup: "list" maps to "get", then DRF's
+    SCHEMA_COERCE_METHOD_NAMES applies (same checks as
+    .get_description()). Cached because DRF resolves api_settings
+    attributes dynamically on every access.
+    """
+    method = "get" if method == "list" else method
+    return api_settings.SCHEMA_COERCE_METHOD_NAMES.get(method, method)
+
+
+def _clear_method_name_caches(*args, **kwargs):
+    _coerce_method_name.cache_clear()
+    # Cached parses looked up their section under the old coercion
+    _DOCSTRING_CACHE.clear()
+
+
+# Keep the caches honest when SCHEMA_COERCE_METHOD_NAMES is overridden in tests
+setting_changed.connect(_clear_method_name_caches)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_status_codes(method: str, obj_num: str, allowed) -> tuple:
+    """
+    Resolve the (status codes, error codes) pair for a method and
+    cardinality, optionally restricted by a view's allowed_status_codes.
+    Sorted for deterministic response ordering; views sharing the same
+    policy hit the cache.
+    """
+    status_codes_cfg = METHOD_STATUS_CODES[method][obj_num]
+    status_codes = status_codes_cfg["status_codes"]
+    error_codes = status_codes_cfg["error_codes"]
+    if allowed is not None:
+        status_codes &= allowed
+        error_codes &= allowed
+    return tuple(sorted(status_codes)), tuple(sorted(error_codes))
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_loader() -> tuple:
+    """
+    Import PyYAML on first use: only schema requests need it, so the
+    many modules importing this one don't pay for it at startup.
+    Prefers the libyaml-backed loader, much faster than the pure-Python
+    one.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml, loader
+
+
+@functools.lru_cache(maxsize=1)
+def _non_printable_table() -> dict:
+    """
+    str.translate table dropping non-printable characters.
+    Newlines are kept (YAML structure depends on them) and tabs become
+    four spaces (YAML forbids tab indentation). Built lazily because it
+    scans the whole Unicode range.
+    """
+    table = {i: None for i in range(0x110000) if not chr(i).isprintable()}
+    del table[ord('\n')]
+    table[ord('\t')] = '    '
+    return table
+
+
+def clear_schema_cache():
+    """
+    Invalidate every cached schema by bumping the version
+    embedded in the cache keys.
+    """
+    try:
+        cache.incr(_SCHEMA_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(_SCHEMA_CACHE_VERSION_KEY, 1, None)
+
+
 class AdvancedSchemaGenerator(SchemaGenerator):
 
     def get_servers(self, request=None):
@@ -34,31 +182,66 @@ class AdvancedSchemaGenerator(SchemaGenerator):
                 "configuration in Django settings.".format(self.__class__.__name__)
             )
             return None
+        valid_servers = []
         for server in servers:
-            if not isinstance(server, dict):
+            if isinstance(server, dict) and "url" in server and "description" in server:
+                valid_servers.append(
+                    {"url": server["url"], "description": server["description"]}
+                )
+            else:
                 warnings.warn(
                     "{}.get_servers() raised an exception during "
                     "schema generation. Server '{}' not valid".format(self.__class__.__name__, server)
                 )
-                servers.remove(server)
-        return [
-            {"url": s["url"], "description": s["description"]}
-            for s in servers if "url" in s and "description" in s
-        ]
+        return valid_servers
 
     def get_schema(self, request=None, public=False):
+        """
+        Serve the schema from the Django cache, building it only on a miss.
+        Set "DRF_OPENAPI_SCHEMA_CACHE_TTL" in Django settings to tune the
+        timeout (seconds, default 300). With DEBUG enabled the cache is
+        bypassed, so code changes show up immediately.
+        """
+        if settings.DEBUG:
+            return self._build_schema(request=request, public=public)
+        timeout = getattr(settings, "DRF_OPENAPI_SCHEMA_CACHE_TTL", 300)
+        return cache.get_or_set(
+            self._get_schema_cache_key(request=request, public=public),
+            lambda: self._build_schema(request=request, public=public),
+            timeout=timeout,
+        )
+
+    def _get_schema_cache_key(self, request=None, public=False):
+        """
+        Key the cached schema on the generator configuration plus, for
+        non-public schemas, (user, host) so permission-filtered schemas
+        don't leak between users or deployments. A public schema ignores
+        the request entirely, so its key drops both: a warm-up built
+        with the same configuration lands on the entry real requests
+        read, and differently configured generators never overwrite
+        each other.
+        """
+        version = cache.get_or_set(_SCHEMA_CACHE_VERSION_KEY, 1, None)
+        identity = hashlib.md5(repr((
+            self.title, self.description, self.version,
+            self.url, self.urlconf, str(self.patterns)
+        )).encode()).hexdigest()
+        if public:
+            return "drf_openapi3:schema:{}:{}:public".format(version, identity)
+        user = getattr(request, "user", None)
+        return "drf_openapi3:schema:{}:{}:{}:{}".format(
+            version,
+            identity,
+            getattr(user, "id", None) or 0,
+            request.get_host() if request else ""
+        )
+
+    def _build_schema(self, request=None, public=False):
         schema = super(AdvancedSchemaGenerator, self).get_schema(
             request=request, public=public
         )
-        schema["components"]["securitySchemes"] = {
-            "ApiKeyAuth": {
-                "type": "apiKey",
-                "in": "header",
-                "name": "Authorization",
-                "description": "Enter your bearer token in the format **Token &lt;token&gt;**",
-            }
-        }
-        schema["security"] = [{"ApiKeyAuth": []}]
+        schema.setdefault("components", {})["securitySchemes"] = _SECURITY_SCHEMES
+        schema["security"] = _SECURITY
         schema["servers"] = self.get_servers(request=request)
         return schema
 
@@ -80,9 +263,7 @@ class AdvancedAutoSchema(AutoSchema):
         """
         Clean before YAML parsing.
         """
-        return ''.join(
-            c for c in data if c.isprintable
-        ).replace("\t", "    ")
+        return data.translate(_non_printable_table())
 
     def add_tag(self, tag):
         self._tags.append(tag)
@@ -101,65 +282,78 @@ class AdvancedAutoSchema(AutoSchema):
         Overrides AutoSchema.get_operation()
         Add Tags, Deprecation and YAML docstring to operation dict
         """
-        operation = super().get_operation(path, method)
+        # Resolve is_list_view() once, every consumer below reuses it
+        self._is_list_view = is_list_view(path, method, self.view)
+        try:
+            operation = super().get_operation(path, method)
+        finally:
+            self._is_list_view = None
         # Deprecated, add attr <deprecated = True> to ApiView
         if self.deprecated:
             operation["deprecated"] = True
-        # Info from Docstring
+        # Info from Docstring, resolved in a single traversal
         info = self.get_docstring(method)
-        error_codes = []
+        error_responses = {}
         for i in info:
+            key = i["key"]
             # It's an int reserved for status codes
-            if isinstance(i["key"], int):
-                error_codes.append(i)
+            if isinstance(key, int):
+                value = i["value"]
+                error_responses[str(key)] = {
+                    "content": self._get_media_types_content(
+                        value.get("schema") or DEFAULT_ERROR_SCHEMA
+                    ),
+                    "description": value.get("description") or STATUS_CODES_RESPONSES[str(key)]['description']
+                }
             # It's a key to be overridden/updated with Docstring key
             elif not i["append"]:
-                operation[i["key"]] = i["value"]
-            elif isinstance(operation[i["key"]], dict):
-                operation[i["key"]].update(i["value"])
-            elif isinstance(operation[i["key"]], list):
-                operation[i["key"]].append(i["value"])
+                operation[key] = i["value"]
+            elif isinstance(operation[key], dict):
+                operation[key].update(i["value"])
+            elif isinstance(operation[key], list):
+                operation[key].append(i["value"])
             else:
                 raise NotImplementedError
-        # Update responses with error codes from Docstring
-        for s in error_codes:
-            description = s["value"]["description"] \
-                if s["value"].get("description") \
-                else STATUS_CODES_RESPONSES[s]['description']
-            schema = s["value"]["schema"] if s["value"].get("schema") else DEFAULT_ERROR_SCHEMA
-            operation["responses"][s["key"]] = self._get_status_code_dict(
-                s["key"], schema,
-                description
-            )[s["key"]]
+        # Error codes from Docstring win over the default responses
+        if error_responses:
+            operation["responses"].update(error_responses)
         return operation
 
     def get_docstring(self, method: str) -> list:
         """
         Get docstring from method or view class.
-        Set <property=True> to append data instead of overwriting it
+        Set <property=True> to append data instead of overwriting it.
+        Parsed docstrings are cached per (view class, method),
+        so each one is only run through the YAML parser once.
         """
-        method_name = getattr(self.view, "action", method.lower())
+        method = method.lower()
+        method_name = getattr(self.view, "action", method)
         method_docstring = getattr(self.view, method_name, None).__doc__
         if method_docstring:
             # An explicit docstring on the method or action.
-            return self._get_yaml_docstring(
-                method.lower(), smart_str(method_docstring),
-                tags=True,
-                responses=True
-            )
+            docstring = smart_str(method_docstring)
         else:
             # ... the class docstring.
-            class_docstring = self.view.get_view_description()
+            docstring = self.view.get_view_description()
             # ... empty docstring, let's try in parent class.
-            if not class_docstring:
-                super_class = self.view.__class__.__bases__[0]()
-                class_docstring = strip_tags(super_class.get_view_description(self.view))
-            return self._get_yaml_docstring(
-                method.lower(),
-                class_docstring,
+            if not docstring:
+                view_cls = type(self.view)
+                docstring = _PARENT_DOCSTRING_CACHE.get(view_cls)
+                if docstring is None:
+                    super_class = view_cls.__bases__[0]()
+                    docstring = strip_tags(super_class.get_view_description(self.view))
+                    _PARENT_DOCSTRING_CACHE[view_cls] = docstring
+        cache_key = (method, docstring)
+        cached = _DOCSTRING_CACHE.get(cache_key)
+        if cached is None:
+            cached = self._get_yaml_docstring(
+                method, docstring,
                 tags=True,
                 responses=True
             )
+            _DOCSTRING_CACHE[cache_key] = cached
+        # get_operation() mutates the parsed values, keep the cached copy pristine
+        return copy.deepcopy(cached)
 
     def _get_yaml_docstring(self, method: str, docstring: str, **many: Dict[str, bool]) -> list:
         """
@@ -169,30 +363,26 @@ class AdvancedAutoSchema(AutoSchema):
         :param many: Pass <property=True> to append/update existing data, else overwrite
         :return: List of properties from YAML-formatted Docstring
         """
-        method = "get" if method == "list" else method
-        # Invalid properties will be ignored
-        valid_properties = (
-            "summary", "description", "tags", "responses",
-            200, 201, 202, 204, 400, 401, 403, 404, 500, 502, 503
-        )
+        method = _coerce_method_name(method)
         # Create valid properties many dict (False: overwrite, True: append/update)
-        for valid_property in valid_properties:
-            many.setdefault(valid_property, False)
-        # Same checks got from .get_descriptions()
-        coerce_method_names = api_settings.SCHEMA_COERCE_METHOD_NAMES
-        if method in coerce_method_names:
-            method = coerce_method_names[method]
+        many = {**_DEFAULT_MANY, **many}
         docstring_for_yaml = self._yaml_safe_clean(docstring)
+        # Plain prose without any mapping, no point in running the parser
+        if not _YAML_HINT.search(docstring_for_yaml):
+            return [{
+                "key": "description",
+                "value": _LINE_EDGE_WS.sub("", formatting.dedent(docstring)),
+                "append": many["description"]
+            }]
+        yaml, yaml_loader = _yaml_loader()
         try:
             # Load YAML
-            yml = yaml.load(docstring_for_yaml, Loader=yaml.SafeLoader)
-        except ScannerError:
+            yml = yaml.load(docstring_for_yaml, Loader=yaml_loader)
+        except yaml.YAMLError:
             # Invalid YAML, let's store the string in description key
             return [{
                 "key": "description",
-                "value": "" + "\n".join(
-                    line.strip() for line in formatting.dedent(docstring).splitlines()
-                ),
+                "value": _LINE_EDGE_WS.sub("", formatting.dedent(docstring)),
                 "append": many["description"]
             }]
         result = yml
@@ -209,25 +399,9 @@ class AdvancedAutoSchema(AutoSchema):
         return [
             {"key": k, "value": v.strip() if isinstance(v, str) else v, "append": many[k]}
             for k, v in result[method].items()
-            if k in valid_properties
+            if k in _VALID_PROPERTIES
         ]
 
-    def _get_status_code_dict(self, status_code: int, schema: dict, description: str) -> dict:
-        """
-        Creates the response
-        :param status_code: Status code
-        :param schema: Schema
-        :param description: status_code description
-        :return:
-        """
-        content = self._get_media_types_content(schema)
-        return {
-            status_code: {
-                "content": content,
-                "description": description
-            }
-        }
-
     def get_responses(self, path: str, method: str) -> dict:
         """
         Overrides AutoSchema._get_responses()
@@ -241,20 +415,30 @@ class AdvancedAutoSchema(AutoSchema):
         serializer = self._get_serializer(path, method)
 
         if isinstance(serializer, serializers.Serializer):
-            item_schema = self._map_serializer(serializer)
+            serializer_cls = type(serializer)
+            mapped = _SERIALIZER_SCHEMA_CACHE.get(serializer_cls)
+            if mapped is None:
+                mapped = self.map_serializer(serializer)
+                _SERIALIZER_SCHEMA_CACHE[serializer_cls] = mapped
+            # The write_only filter below mutates the mapping,
+            # keep the cached copy pristine
+            item_schema = copy.deepcopy(mapped)
             # No write_only fields for response.
-            for name, schema in item_schema['properties'].copy().items():
-                if 'writeOnly' in schema:
-                    del item_schema['properties'][name]
-                    if 'required' in item_schema:
-                        item_schema['required'] = [f for f in item_schema['required'] if f != name]
+            props = item_schema['properties']
+            item_schema['properties'] = {
+                name: schema for name, schema in props.items()
+                if 'writeOnly' not in schema
+            }
+            if 'required' in item_schema and len(item_schema['properties']) != len(props):
+                keep = item_schema['properties'].keys()
+                item_schema['required'] = [f for f in item_schema['required'] if f in keep]
 
         if self.handles_many_objects:
             response_schema = {
                 'type': 'array',
                 'items': item_schema,
             }
-            if is_list_view(path, method, self.view):
+            if self._resolve_is_list_view(path, method):
                 paginator = self._get_paginator()
                 if paginator:
                     response_schema = paginator.get_paginated_response_schema(response_schema)
@@ -262,7 +446,7 @@ class AdvancedAutoSchema(AutoSchema):
             response_schema = item_schema
         if getattr(settings, 'STATIC_ERROR_CODES', False) is False:
             return {
-                200: {
+                '200': {
                     'content': {
                         ct: {'schema': response_schema}
                         for ct in self.response_media_types
@@ -278,46 +462,94 @@ class AdvancedAutoSchema(AutoSchema):
 
     def _get_allowed_responses(self, method: str, schema: dict) -> dict:
         """
-        Returns the OpenApi responses based on settings
+        Returns the OpenApi responses based on settings.
+        Identical response shapes come up once per view method, so
+        results are cached per (method, cardinality, allowed codes,
+        media types, schema shape).
         :param method: Request method
         :param schema: Schema for successful requests, else default error schema is used
         :return: OpenApi responses dict based on settings
         """
-        allowed_responses = {}
         obj_num = 'one'
         if self.handles_many_objects:
             obj_num = 'many'
-        if getattr(self.view, 'allowed_status_codes', None):
-            allowed_status_codes = [
-                x for x in METHOD_STATUS_CODES[method][obj_num]["status_codes"] if x in self.view.allowed_status_codes
-            ]
-            allowed_error_codes = [
-                x for x in METHOD_STATUS_CODES[method][obj_num]["error_codes"] if x in self.view.allowed_status_codes
-            ]
-        else:
-            allowed_status_codes = METHOD_STATUS_CODES[method][obj_num]["status_codes"]
-            allowed_error_codes = METHOD_STATUS_CODES[method][obj_num]["error_codes"]
+        allowed = getattr(self.view, 'allowed_status_codes', None)
+        # Views declare allowed_status_codes as ints, the settings
+        # tables are keyed on strings
+        allowed = frozenset(str(x) for x in allowed) if allowed else None
+        cache_key = (
+            method, obj_num, allowed,
+            tuple(self.response_media_types),
+            json.dumps(schema, sort_keys=True, default=str)
+        )
+        cached = _ALLOWED_RESPONSES_CACHE.get(cache_key)
+        if cached is None:
+            cached = self._build_allowed_responses(method, obj_num, allowed, schema)
+            _ALLOWED_RESPONSES_CACHE[cache_key] = cached
+        # Callers may mutate the responses, keep the cached copy pristine
+        return copy.deepcopy(cached)
+
+    def _build_allowed_responses(self, method: str, obj_num: str, allowed, schema: dict) -> dict:
+        """
+        Does the actual work for _get_allowed_responses() on a cache miss
+        """
+        allowed_responses = {}
+        allowed_status_codes, allowed_error_codes = _resolve_status_codes(
+            method, obj_num, allowed
+        )
+        # The content wrapper is identical for every successful status
+        # code, build it once and share the reference
+        success_content = self._get_media_types_content(schema)
         for s in allowed_status_codes:
-            allowed_responses[s] = self._get_status_code_dict(
-                s, schema, STATUS_CODES_RESPONSES[s]['description']
-            )[s]
+            response = {
+                "content": success_content,
+                "description": STATUS_CODES_RESPONSES[s]['description']
+            }
             if STATUS_CODES_RESPONSES[s].get('content', True) is False:
-                allowed_responses[s].pop('content', None)
+                del response['content']
+            allowed_responses[s] = response
+        # Error responses only depend on constants, build them once
+        # per media-types combination and reuse
+        media_types = tuple(self.response_media_types)
+        error_content = None
         for s in allowed_error_codes:
-            allowed_responses[s] = self._get_status_code_dict(
-                s, DEFAULT_ERROR_SCHEMA, STATUS_CODES_RESPONSES[s]['description']
-            )[s]
-            if STATUS_CODES_RESPONSES[s].get('content', True) is False:
-                allowed_responses[s].pop('content', None)
+            template = _ERROR_RESPONSE_CACHE.get((media_types, s))
+            if template is None:
+                if error_content is None:
+                    # Same default error schema for every code,
+                    # one wrapper serves all the misses
+                    error_content = self._get_media_types_content(DEFAULT_ERROR_SCHEMA)
+                template = {
+                    "content": error_content,
+                    "description": _ERROR_FRAGMENTS[s]["description"]
+                }
+                if STATUS_CODES_RESPONSES[s].get('content', True) is False:
+                    template.pop('content')
+                _ERROR_RESPONSE_CACHE[(media_types, s)] = template
+            allowed_responses[s] = dict(template)
         return allowed_responses
 
+    def map_renderers(self, path: str, method: str) -> list:
+        """
+        Overrides AutoSchema.map_renderers()
+        Renderers don't depend on (path, method), so resolve them
+        once per view class and reuse the result.
+        """
+        view_cls = type(self.view)
+        if getattr(self, '_media_types_view_cls', None) is not view_cls:
+            self._media_types = super().map_renderers(path, method)
+            self._media_types_view_cls = view_cls
+        return self._media_types
+
     def _get_media_types_content(self, schema: dict) -> dict:
         """
         Replicates schema for each supported content-type
         :param schema: Schema to replicate
         :return: OpenApi responses content
         """
+        if schema.get("properties") == {}:
+            schema = {}
         return {
-            ct: {'schema': schema if schema.get("properties") != {} else {}}
+            ct: {'schema': schema}
             for ct in self.response_media_types
         }
\ No newline at end of file
@@ -4,6 +4,7 @@ from collections import OrderedDict
 from decimal import Decimal
 from operator import attrgetter
 from urllib.parse import urljoin
+from weakref import WeakKeyDictionary
 
 from django.core.validators import (
     DecimalValidator, EmailValidator, MaxLengthValidator, MaxValueValidator,
@@ -116,6 +117,10 @@ class SchemaGenerator(BaseSchemaGenerator):
 
 # View Inspectors
 
+# Derived operation ids per view class: the reflective name derivation
+# only depends on the class, the action and the configured base name
+_OPERATION_ID_CACHE = WeakKeyDictionary()
+
 
 class AutoSchema(ViewInspector):
 
@@ -142,6 +147,19 @@ class AutoSchema(ViewInspector):
         'delete': 'destroy',
     }
 
+    # Set for the duration of a get_operation() call by subclasses that
+    # resolve is_list_view() up front
+    _is_list_view = None
+
+    def _resolve_is_list_view(self, path, method):
+        """
+        Reuse the per-operation is_list_view() result when available,
+        fall back to a direct call otherwise.
+        """
+        if self._is_list_view is None:
+            return is_list_view(path, method, self.view)
+        return self._is_list_view
+
     def get_operation(self, path, method):
         operation = {}
 
@@ -249,18 +267,29 @@ class AutoSchema(ViewInspector):
     def get_operation_id(self, path, method):
         """
         Compute an operation ID from the view type and get_operation_id_base method.
+        Derived ids are cached per view class, the reflective name
+        derivation is only run once per (action, base name).
         """
-        method_name = getattr(self.view, 'action', method.lower())
-        if is_list_view(path, method, self.view):
+        method_lower = method.lower()
+        method_name = getattr(self.view, 'action', method_lower)
+        per_class = _OPERATION_ID_CACHE.setdefault(self.view.__class__, {})
+        cache_key = (method_name, self._resolve_is_list_view(path, method), self.operation_id_base)
+        operation_id = per_class.get(cache_key)
+        if operation_id is not None:
+            return operation_id
+
+        if cache_key[1]:
             action = 'list'
         elif method_name not in self.method_mapping:
             action = self._to_camel_case(method_name)
         else:
-            action = self.method_mapping[method.lower()]
+            action = self.method_mapping[method_lower]
 
         name = self.get_operation_id_base(path, method, action)
 
-        return action + name
+        operation_id = action + name
+        per_class[cache_key] = operation_id
+        return operation_id
 
     def get_path_parameters(self, path, method):
         """
@@ -322,7 +351,7 @@ class AutoSchema(ViewInspector):
     def get_pagination_parameters(self, path, method):
         view = self.view
 
-        if not is_list_view(path, method, view):
+        if not self._resolve_is_list_view(path, method):
             return []
 
         paginator = self.get_paginator()